@@ -0,0 +1,28 @@
+"""
+Shared file helpers for the resources.yaml scripts
+"""
+
+import contextlib
+import os
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+
+@contextlib.contextmanager
+def atomic_write(path: Any, mode: str = 'w', **open_kwargs: Any) -> Iterator[IO]:
+    """
+    Open a pid-named temporary file next to path and swap it into place
+    with os.replace once the block finishes.
+
+    If the block or the swap fails, the temporary file is removed and
+    path is left as it was.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, mode, **open_kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
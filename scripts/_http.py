@@ -0,0 +1,29 @@
+"""
+Shared HTTP session setup for the resources.yaml scripts
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from urllib3.util.retry import Retry
+
+# Connections kept open per host; covers every script's worker count
+POOL_SIZE = 32
+
+
+def create_session(headers: Dict[str, str], retry: Optional[Retry] = None) -> requests.Session:
+    """
+    Create a session that reuses connections across requests, sending
+    the given headers and optionally retrying through the adapter.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry if retry is not None else 0
+    )
+
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -0,0 +1,54 @@
+"""
+Shared, cached YAML loading for the resources.yaml scripts
+"""
+
+import os
+import functools
+import mmap
+import yaml
+from typing import Any
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class NoAliasDumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):
+    """Safe dumper (libyaml-backed when available) that never emits anchors."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        # Resources share no nodes, so skip the alias bookkeeping for every one
+        return True
+
+
+DUMPER = NoAliasDumper
+
+
+def parse_yaml_file(path: Any) -> Any:
+    """
+    Parse a YAML file straight from a read-only memory map, so the file
+    is never also held as one bytes object.
+    """
+    # libyaml decodes UTF-8 itself, so skip the text and buffered I/O layers
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None  # An empty document; mmap can't map zero bytes
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return yaml.load(mapped, Loader=LOADER)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; the mtime is part of the cache key so edits are picked up."""
+    return parse_yaml_file(path)
+
+
+def load_resources_cached(path: Any) -> Any:
+    """
+    Load a YAML file, reusing the parsed result within this process
+    until the file changes on disk.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    path = os.fspath(path)
+    return _load_yaml(path, os.stat(path).st_mtime_ns)
@@ -4,56 +4,105 @@ Analyze changes in a PR for GitHub Actions
 """
 
 import yaml
+import functools
 import json
+import os
 import sys
 import subprocess
+from datetime import date
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, FrozenSet, Optional, Set, Tuple
 
+from _yaml_cache import LOADER, load_resources_cached
+from validate import run_validation
+
+# Fields that mark a resource as modified (excludes auto-generated fields like github_stars)
+COMPARE_FIELDS = ('title', 'url', 'domains', 'type', 'maturity', 'tags', 'summary', 'why_useful', 'good_for')
+
+# Refs to compare against, in order: the parent commit, then the PR base branch
+BASE_REFS = ('HEAD~1', 'origin/main')
+
+
+def get_event_base_sha() -> Optional[str]:
+    """Get the PR base commit from the GitHub Actions event payload, if there is one."""
+    event_path = os.environ.get('GITHUB_EVENT_PATH')
+    if not event_path:
+        return None
 
-def get_git_diff() -> List[str]:
-    """Get the list of changed files from git."""
     try:
+        with open(event_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['pull_request']['base']['sha']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _diff_against_base() -> Tuple[Optional[str], FrozenSet[str]]:
+    """Diff HEAD against the first usable base ref; return the ref and changed files."""
+    event_base_sha = get_event_base_sha()
+    refs = (event_base_sha,) + BASE_REFS if event_base_sha else BASE_REFS
+
+    for ref in refs:
         result = subprocess.run(
-            ['git', 'diff', '--name-only', 'HEAD~1', 'HEAD'],
+            ['git', 'diff', '--name-only', ref, 'HEAD'],
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
-            return result.stdout.strip().split('\n') if result.stdout.strip() else []
-        else:
-            # Fallback for PR context
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', 'origin/main', 'HEAD'],
-                capture_output=True,
-                text=True
-            )
-            return result.stdout.strip().split('\n') if result.stdout.strip() else []
+            if ref != refs[0]:
+                print(f"⚠️ {refs[0]} is not available locally, comparing against {ref}")
+            return ref, frozenset(result.stdout.splitlines())
+
+    print(f"⚠️ Could not diff against any of {', '.join(refs)}; is the checkout shallow?")
+    return None, frozenset()
+
+
+def get_base_ref() -> Optional[str]:
+    """Get the ref that changes are compared against, or None if none is usable."""
+    return _diff_against_base()[0]
+
+
+def get_git_diff() -> Set[str]:
+    """Get the set of changed files from git."""
+    try:
+        return set(_diff_against_base()[1])
     except Exception as e:
         print(f"⚠️ Could not get git diff: {e}")
-        return []
+        return set()
 
 
-def load_resources(yaml_path: str) -> Dict[str, Any]:
-    """Load resources from YAML file."""
+def load_resources(yaml_path: str) -> List[Dict[str, Any]]:
+    """Load the resource list from YAML file."""
     path = Path(yaml_path)
     if not path.exists():
-        return {'resources': []}
+        return []
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {'resources': []}
+        return (load_resources_cached(path) or {}).get('resources', [])
     except Exception as e:
         print(f"⚠️ Error loading {yaml_path}: {e}")
-        return {'resources': []}
+        return []
 
 
-def get_resource_by_id(resources: List[Dict[str, Any]], resource_id: str) -> Dict[str, Any]:
-    """Find a resource by its ID."""
+def index_by_id(resources: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map IDs to resources in a single pass, skipping entries without an ID."""
+    index = {}
     for resource in resources:
-        if resource.get('id') == resource_id:
-            return resource
-    return {}
+        resource_id = resource.get('id')
+        if resource_id:
+            index[resource_id] = resource
+    return index
+
+
+def to_json_safe(value: Any) -> Any:
+    """Convert unquoted YAML dates, at any depth, to ISO strings so the value serializes as JSON."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {to_json_safe(key): to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json_safe(item) for item in value]
+    return value
 
 
 def analyze_resources_changes() -> Dict[str, Any]:
@@ -70,79 +119,66 @@ def analyze_resources_changes() -> Dict[str, Any]:
         }
 
     # Load current and previous versions
-    current_data = load_resources('data/resources.yaml')
-    current_resources = current_data.get('resources', [])
+    current_resources = load_resources('data/resources.yaml')
 
-    # Try to get the previous version from git
+    # Get the previous version from the same base ref the diff used
+    previous_resources = []
     try:
-        result = subprocess.run(
-            ['git', 'show', 'HEAD~1:data/resources.yaml'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            previous_data = yaml.safe_load(result.stdout) or {'resources': []}
-            previous_resources = previous_data.get('resources', [])
-        else:
-            # Fallback for PR context
-            result = subprocess.run(
-                ['git', 'show', 'origin/main:data/resources.yaml'],
-                capture_output=True,
-                text=True
-            )
-            previous_data = yaml.safe_load(result.stdout) if result.returncode == 0 else {'resources': []}
-            previous_resources = previous_data.get('resources', [])
+        base_ref = get_base_ref()
+        if base_ref:
+            # Feed git's output straight to the parser instead of buffering it as a str
+            with subprocess.Popen(
+                ['git', 'show', f'{base_ref}:data/resources.yaml'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as proc:
+                resources = (yaml.load(proc.stdout, Loader=LOADER) or {}).get('resources', [])
+                if proc.wait() == 0:
+                    previous_resources = resources
     except Exception as e:
         print(f"⚠️ Could not get previous version: {e}")
         previous_resources = []
 
-    # Create ID sets for comparison
-    current_ids = {r.get('id') for r in current_resources if r.get('id')}
-    previous_ids = {r.get('id') for r in previous_resources if r.get('id')}
+    # Index resources by ID; the key views double as ID sets for comparison
+    current_by_id = index_by_id(current_resources)
+    previous_by_id = index_by_id(previous_resources)
+    current_ids = current_by_id.keys()
+    previous_ids = previous_by_id.keys()
 
     # Find new, modified, and removed resources
     new_ids = current_ids - previous_ids
     removed_ids = previous_ids - current_ids
     potentially_modified_ids = current_ids & previous_ids
 
-    new_resources = [r for r in current_resources if r.get('id') in new_ids]
-    removed_resources = [r for r in previous_resources if r.get('id') in removed_ids]
+    new_resources = [r for rid, r in current_by_id.items() if rid in new_ids]
+    removed_resources = [r for rid, r in previous_by_id.items() if rid in removed_ids]
 
     # Check for modifications
     modified_resources = []
     for resource_id in potentially_modified_ids:
-        current_resource = get_resource_by_id(current_resources, resource_id)
-        previous_resource = get_resource_by_id(previous_resources, resource_id)
+        current_resource = current_by_id[resource_id]
+        previous_resource = previous_by_id[resource_id]
 
-        # Compare key fields (exclude auto-generated fields like github_stars)
-        compare_fields = ['title', 'url', 'domains', 'type', 'maturity', 'tags', 'summary', 'why_useful', 'good_for']
+        # Compare all key fields in one tuple comparison
+        current_values = tuple(map(current_resource.get, COMPARE_FIELDS))
+        previous_values = tuple(map(previous_resource.get, COMPARE_FIELDS))
+        if current_values != previous_values:
+            modified_resources.append(current_resource)
 
-        for field in compare_fields:
-            if current_resource.get(field) != previous_resource.get(field):
-                modified_resources.append(current_resource)
-                break
-
-    # Run validation and collect warnings
+    # Run validation in-process on the already-loaded data and collect warnings
     validation_warnings = []
     try:
-        result = subprocess.run(
-            ['python', 'scripts/validate.py'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            # Extract warnings from validation output
-            output_lines = result.stdout.split('\n') + result.stderr.split('\n')
-            for line in output_lines:
-                if 'Warning' in line or '⚠️' in line:
-                    validation_warnings.append(line.strip())
+        exit_code, warnings = run_validation(current_resources)
+        if exit_code != 0:
+            validation_warnings.append("Validation failed with errors, run scripts/validate.py for details")
+        validation_warnings.extend(warnings)
     except Exception as e:
         validation_warnings.append(f"Could not run validation: {e}")
 
     return {
-        'new_resources': new_resources,
-        'modified_resources': modified_resources,
-        'removed_resources': removed_resources,
+        'new_resources': [to_json_safe(r) for r in new_resources],
+        'modified_resources': [to_json_safe(r) for r in modified_resources],
+        'removed_resources': [to_json_safe(r) for r in removed_resources],
         'validation_warnings': validation_warnings[:10]  # Limit to top 10
     }
 
@@ -3,20 +3,84 @@
 Check accessibility of all URLs in resources.yaml
 """
 
-import yaml
 import requests
 import json
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Tuple
 from urllib.parse import urlparse
-import time
+from urllib3.util.retry import Retry
 
+from _http import create_session
+from _yaml_cache import load_resources_cached
 
-def check_url(url: str, timeout: int = 10, max_retries: int = 2) -> Dict[str, Any]:
+# Concurrency limits: total in-flight checks, and per host to be nice to servers
+MAX_WORKERS = 20
+PER_HOST_LIMIT = 2
+
+# Number of checked resources whose progress lines are written in one go
+PROGRESS_BATCH = 20
+
+_host_semaphores = defaultdict(lambda: threading.Semaphore(PER_HOST_LIMIT))
+_host_semaphores_lock = threading.Lock()
+
+# HEAD statuses that often mean "HEAD not supported" even though GET works
+HEAD_REJECTED_STATUSES = {400, 403, 405}
+
+# Hosts where a GET succeeded after HEAD was rejected; later URLs on them go straight to GET
+_prefer_get: Set[str] = set()
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Engineering-Arsenal-LinkChecker/1.0'
+}
+
+
+# Retry transient failures with a short backoff
+REQUEST_RETRY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+    # Never sleep for as long as a server's Retry-After asks (429/503 can say hours)
+    respect_retry_after_header=False
+)
+
+# Shared across checks so DNS lookups and TCP/TLS connections are reused per host
+SESSION = create_session(REQUEST_HEADERS, REQUEST_RETRY)
+
+
+def get_host_semaphore(netloc: str) -> threading.Semaphore:
+    """Return the semaphore limiting concurrent checks against a host."""
+    with _host_semaphores_lock:
+        return _host_semaphores[netloc]
+
+
+def flush_progress(lines: List[str]) -> None:
+    """Write buffered progress lines with a single write and clear the buffer."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+        lines.clear()
+
+
+def fetch_headers(url: str, timeout: Tuple[float, float]) -> requests.Response:
+    """GET a URL without downloading its body."""
+    response = SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True)
+    response.close()
+    return response
+
+
+def check_url(url: str, timeout: Tuple[float, float] = (5.0, 15.0)) -> Dict[str, Any]:
     """
     Check if a URL is accessible.
 
+    The timeout is a (connect, read) pair so unreachable hosts fail fast
+    while slow but live servers still get time to respond. Transient
+    failures are retried by the session's adapter.
+
     Returns:
         Dict with 'accessible', 'status_code', 'error', and 'redirect_url' keys
     """
@@ -26,32 +90,25 @@ def check_url(url: str, timeout: int = 10, max_retries: int = 2) -> Dict[str, An
         'error': None,
         'redirect_url': None
     }
+    netloc = urlparse(url).netloc
 
-    for attempt in range(max_retries + 1):
+    # Limit concurrent requests per host
+    with get_host_semaphore(netloc):
         try:
-            # Try HEAD first (faster)
-            response = requests.head(
-                url,
-                timeout=timeout,
-                allow_redirects=True,
-                headers={
-                    'User-Agent': 'Engineering-Arsenal-LinkChecker/1.0'
-                }
-            )
+            # Try HEAD first (faster) unless the host is known to reject it
+            if netloc in _prefer_get:
+                response = fetch_headers(url, timeout)
+            else:
+                response = SESSION.head(url, timeout=timeout, allow_redirects=True)
 
-            result['status_code'] = response.status_code
+                # If HEAD is rejected, retry with GET; only a GET that succeeds where
+                # HEAD failed shows the host won't serve HEAD (a 403 may just be this URL)
+                if response.status_code in HEAD_REJECTED_STATUSES:
+                    response = fetch_headers(url, timeout)
+                    if response.status_code < 400:
+                        _prefer_get.add(netloc)
 
-            # If HEAD fails with 405 (Method Not Allowed), try GET
-            if response.status_code == 405:
-                response = requests.get(
-                    url,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    headers={
-                        'User-Agent': 'Engineering-Arsenal-LinkChecker/1.0'
-                    }
-                )
-                result['status_code'] = response.status_code
+            result['status_code'] = response.status_code
 
             # Check for redirects
             if response.url != url:
@@ -60,12 +117,13 @@ def check_url(url: str, timeout: int = 10, max_retries: int = 2) -> Dict[str, An
             # Consider status codes < 400 as successful
             if response.status_code < 400:
                 result['accessible'] = True
-                return result
             else:
                 result['error'] = f"HTTP {response.status_code}"
 
+        except requests.exceptions.ConnectTimeout:
+            result['error'] = f"Connect timeout after {timeout[0]}s"
         except requests.exceptions.Timeout:
-            result['error'] = f"Timeout after {timeout}s"
+            result['error'] = f"Read timeout after {timeout[1]}s"
         except requests.exceptions.ConnectionError:
             result['error'] = "Connection failed"
         except requests.exceptions.SSLError:
@@ -77,10 +135,6 @@ def check_url(url: str, timeout: int = 10, max_retries: int = 2) -> Dict[str, An
         except Exception as e:
             result['error'] = f"Unexpected error: {str(e)[:50]}"
 
-        # Wait before retry (except on last attempt)
-        if attempt < max_retries:
-            time.sleep(1)
-
     return result
 
 
@@ -94,8 +148,7 @@ def check_all_links() -> bool:
 
     # Load resources
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = load_resources_cached(yaml_path)
     except Exception as e:
         print(f"❌ Error loading YAML: {e}")
         return False
@@ -109,8 +162,8 @@ def check_all_links() -> bool:
 
     broken_links = []
     accessible_count = 0
-    total_checked = 0
 
+    to_check = []
     for i, resource in enumerate(resources, 1):
         url = resource.get('url')
         resource_id = resource.get('id', f'resource_{i}')
@@ -120,30 +173,42 @@ def check_all_links() -> bool:
             print(f"⚠️ {resource_id}: No URL specified")
             continue
 
-        total_checked += 1
-        print(f"🔗 [{i}/{len(resources)}] Checking {resource_id}...")
-
-        # Check URL accessibility
-        result = check_url(url)
-
-        if result['accessible']:
-            accessible_count += 1
-            status_msg = f"✅ {resource_id}: OK"
-            if result['redirect_url']:
-                status_msg += f" (redirected to {result['redirect_url']})"
-            print(status_msg)
-        else:
-            broken_links.append({
-                'id': resource_id,
-                'title': title,
-                'url': url,
-                'status': result['status_code'],
-                'error': result['error']
-            })
-            print(f"❌ {resource_id}: {result['error']} - {url}")
-
-        # Small delay to be nice to servers
-        time.sleep(0.5)
+        to_check.append((i, resource_id, title, url))
+
+    total_checked = len(to_check)
+
+    # Check each distinct URL once, concurrently; report in resource order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for _, _, _, url in to_check:
+            if url not in futures:
+                futures[url] = executor.submit(check_url, url)
+
+        progress = []
+        for n, (i, resource_id, title, url) in enumerate(to_check, 1):
+            result = futures[url].result()
+            progress.append(f"🔗 [{i}/{len(resources)}] Checking {resource_id}...")
+
+            if result['accessible']:
+                accessible_count += 1
+                status_msg = f"✅ {resource_id}: OK"
+                if result['redirect_url']:
+                    status_msg += f" (redirected to {result['redirect_url']})"
+                progress.append(status_msg)
+            else:
+                broken_links.append({
+                    'id': resource_id,
+                    'title': title,
+                    'url': url,
+                    'status': result['status_code'],
+                    'error': result['error']
+                })
+                progress.append(f"❌ {resource_id}: {result['error']} - {url}")
+
+            if n % PROGRESS_BATCH == 0:
+                flush_progress(progress)
+
+        flush_progress(progress)
 
     # Report results
     print(f"\n📊 Link Check Results:")
@@ -4,12 +4,21 @@ Generate README.md from resources.yaml - Hybrid Version
 Beautiful presentation with advanced categorization algorithm.
 """
 
-import yaml
-import re
+import functools
+import hashlib
+import heapq
+import json
+import sys
 from datetime import datetime
 from pathlib import Path
+from sys import intern
 from collections import defaultdict, Counter
-from typing import Dict, List, Any, Optional
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Dict, Iterator, List, Any, Optional
+
+from _fs import atomic_write
+from _yaml_cache import parse_yaml_file
 
 # Consistent emoji mappings (from original)
 MATURITY_EMOJI = {
@@ -21,9 +30,33 @@ MATURITY_EMOJI = {
 
 EFFORT_EMOJI = {"Low": "🎯", "Medium": "⚙️", "High": "🚀"}
 
+# good_for values that lower the effort level (checked in this order)
+MEDIUM_EFFORT_GOOD_FOR = ("mlops", "testing")
+
 # New advanced sorting constants
 MATURITY_RANK = {"Battle-tested": 0, "Adopted": 1, "Emerging": 2, "Experimental": 3}
 GOOD_FOR_PRIORITY = ["production", "mlops", "testing", "evaluation", "prototyping"]
+GOOD_FOR_RANK = {good_for: rank for rank, good_for in enumerate(GOOD_FOR_PRIORITY)}
+QUICK_WIN_MATURITY = {"Battle-tested", "Emerging"}
+
+# Accepted date formats, keyed by how many "-" separators they contain
+DATE_FORMATS = {2: "%Y-%m-%d", 1: "%Y-%m", 0: "%Y"}
+
+# Reads the key precomputed by prepare_resources() (decorate-sort-undecorate)
+SORT_KEY = itemgetter("_sort_key")
+
+# Digests of the last run's inputs and output, used to skip unchanged rebuilds
+README_CACHE_PATH = Path(".cache/generate.json")
+
+# Local modules (this script and its sibling helpers) live here
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Write buffer for README.md, large enough that streamed sections go out in a few syscalls
+README_WRITE_BUFFER = 1 << 20
+
+# Number of tags shown in the tag cloud, ranked by count
+TAG_CLOUD_SIZE = 12
+TAG_COUNT = itemgetter(1)
 DOMAINS = {
     "AI-Engineering": (
         "🤖 **AI Engineering**",
@@ -57,6 +90,129 @@ DOMAINS = {
     ),
 }
 
+# Plain names for the navigation links: the heading without its emoji and bold markers
+NAV_TITLES = {
+    domain: emoji_title.replace("**", "").split(" ", 1)[1]
+    for domain, (emoji_title, _, _) in DOMAINS.items()
+}
+
+# Domain table row; the title cell links out and carries the star count
+RESOURCE_ROW_TEMPLATE = (
+    "| **[{title} <small>&#10548;</small>]({url})**{github_info}"
+    " | {maturity} | {effort} | {use_cases} | {summary} |"
+)
+
+# Summaries longer than this are cut and end with an ellipsis
+SUMMARY_MAX_LENGTH = 120
+ELLIPSIS = "..."
+
+# Quick navigation table cells
+NAV_LINK_TEMPLATE = "[Jump to {title}](#{anchor})"
+NAV_COUNT_TEMPLATE = "**{count} resources**"
+NAV_DESCRIPTION_TEMPLATE = "*{description}*"
+
+# Body rows of the navigation table, rendered in order under the header row
+NAV_ROW_TEMPLATES = (NAV_LINK_TEMPLATE, NAV_COUNT_TEMPLATE, NAV_DESCRIPTION_TEMPLATE)
+
+# Section headings and descriptions for each domain
+DOMAIN_TITLES = {
+    "AI-Engineering": "🤖 AI Engineering",
+    "Machine-Learning": "🧠 Machine Learning",
+    "Platform-Engineering": "🏗️ Platform Engineering",
+    "Data-Engineering": "📊 Data Engineering",
+    "Security": "🔒 Security & Compliance",
+    "Developer-Tools": "🛠️ Developer Tools",
+}
+DOMAIN_DESCRIPTIONS = {
+    "AI-Engineering": "Agents/MCP, RAG & knowledge systems, LLM applications, AI integration.",
+    "Machine-Learning": "Training frameworks, MLOps, evaluation, monitoring, model management, ML system design.",
+    "Platform-Engineering": "Observability & performance, infra & services (IaC), container platforms, build & delivery, docs/runbooks.",
+    "Data-Engineering": "Discovery & governance, query & storage, pipelines & orchestration, analytics & BI.",
+    "Security": "Supply chain & vuln mgmt, infra/runtime security, secrets/auth/compliance.",
+    "Developer-Tools": "Code quality, browser/web tools, CLI/editors/productivity, creative/specialized, SLMs.",
+}
+
+# Domain-specific subcategory rules, checked in order: (label, tags), then fallback
+_SUBCATEGORY_RULE_TABLE = {
+    "AI-Engineering": (
+        [
+            ("Agent Systems & Integration", ["agents", "mcp", "integration", "protocol"]),
+            ("RAG & Knowledge Systems", ["rag", "graph-rag", "knowledge-graphs", "retrieval"]),
+            ("Testing & Evaluation", ["evaluation", "testing", "prompts"]),
+            ("Architecture & Best Practices", ["architecture", "case-studies", "patterns"]),
+        ],
+        "Core AI Tools",
+    ),
+    "Machine-Learning": (
+        [
+            ("Training & Frameworks", ["training", "frameworks"]),
+            ("MLOps & Monitoring", ["mlops", "monitoring", "evaluation"]),
+            ("ML System Design", ["case-studies", "architecture", "patterns"]),
+            ("Learning Resources", ["learning", "course"]),
+        ],
+        "ML Tools & Utilities",
+    ),
+    "Platform-Engineering": (
+        [
+            ("Performance & Observability", ["performance", "monitoring", "observability"]),
+            ("Infrastructure & Services (IaC)", ["infrastructure", "iac", "services", "self-hosting"]),
+            ("Container Platforms", ["containers", "docker", "kubernetes"]),
+            ("Build & Delivery", ["ci-cd", "build", "delivery"]),
+            ("Docs/Runbooks", ["documentation", "architecture"]),
+        ],
+        "Platform Tools",
+    ),
+    "Data-Engineering": (
+        [
+            ("Discovery & Governance", ["discovery", "governance", "catalog"]),
+            ("Query & Storage", ["query", "sql", "database"]),
+            ("Pipelines & Orchestration", ["pipelines", "orchestration", "etl"]),
+            ("Analytics & BI", ["analytics", "bi"]),
+        ],
+        "Data Infrastructure",
+    ),
+    "Security": (
+        [
+            ("Supply Chain & Vuln Mgmt", ["supply-chain", "vulnerability-scanning"]),
+            ("Infra/Runtime Security", ["runtime-security", "infrastructure"]),
+            ("Secrets/Auth/Compliance", ["secrets", "auth", "compliance"]),
+        ],
+        "Security Tools",
+    ),
+    "Developer-Tools": (
+        [
+            ("Specialized Models (SLMs)", ["small-language-models"]),
+            ("Code Quality & Standards", ["code-formatting", "linting", "git-hooks", "pre-commit"]),
+            ("Browser & Web Tools", ["browser-automation", "chrome-extension"]),
+            ("Creative & Specialized Tools", ["creative-tools"]),
+        ],
+        "Development Utilities",
+    ),
+}
+DEFAULT_SUBCATEGORY = "Tools & Utilities"
+
+# Per domain: (rule labels in order, fallback label)
+SUBCATEGORY_RULES = {
+    domain: (tuple(label for label, _ in rules), fallback)
+    for domain, (rules, fallback) in _SUBCATEGORY_RULE_TABLE.items()
+}
+
+
+def _build_tag_ranks(rules: List[tuple]) -> Dict[str, int]:
+    """Map each tag to the index of the first rule that lists it."""
+    ranks = {}
+    for rank, (_, tags) in enumerate(rules):
+        for tag in tags:
+            ranks.setdefault(tag, rank)
+    return ranks
+
+
+# Per domain: tag -> rule index, so grouping needs one lookup per resource tag
+SUBCATEGORY_TAG_RANKS = {
+    domain: _build_tag_ranks(rules)
+    for domain, (rules, _) in _SUBCATEGORY_RULE_TABLE.items()
+}
+
 
 def load_resources() -> Dict[str, Any]:
     """Load and validate resources from YAML file."""
@@ -64,8 +220,8 @@ def load_resources() -> Dict[str, Any]:
     if not yaml_path.exists():
         raise FileNotFoundError(f"Resources file not found: {yaml_path}")
 
-    with open(yaml_path, "r", encoding="utf-8") as file:
-        data = yaml.safe_load(file)
+    # A private parse, since prepare_resources adds keys to every resource
+    data = parse_yaml_file(yaml_path)
 
     if "resources" not in data:
         raise ValueError("YAML must contain 'resources' key")
@@ -73,60 +229,173 @@ def load_resources() -> Dict[str, Any]:
     return data
 
 
-def format_resource_row(resource: Dict[str, Any]) -> str:
-    """Format a resource as a table row with improved styling."""
+def file_digest(path: Path) -> Optional[str]:
+    """Return a hex digest of a file's bytes, or None if it can't be read."""
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def local_module_paths() -> List[Path]:
+    """Return the source files of every loaded module from scripts/, including this one."""
+    paths = set()
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and module_file.endswith(".py"):
+            path = Path(module_file).resolve()
+            if path.parent == SCRIPTS_DIR:
+                paths.add(path)
+    return sorted(paths)
+
+
+def compute_input_digest(yaml_path: Path) -> str:
+    """Digest everything the README depends on: the data, the local code and the month badge."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(yaml_path.read_bytes())
+    for path in local_module_paths():
+        digest.update(path.read_bytes())
+    digest.update(datetime.now().strftime("%B %Y").encode())
+    return digest.hexdigest()
+
+
+def readme_is_current(input_digest: str, readme_path: Path) -> bool:
+    """Check whether README.md was generated from these exact inputs and is untouched."""
+    try:
+        cache = json.loads(README_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+
+    return (
+        cache.get("input") == input_digest
+        and cache.get("readme") == file_digest(readme_path)
+    )
 
-    # Enhanced title with bold formatting and metadata
-    github_info = ""
-    if resource.get("github_stars"):
-        stars = resource["github_stars"]
-        if stars >= 1000:
-            formatted_stars = (
-                f"{stars/1000:.0f}K" if stars % 1000 == 0 else f"{stars/1000:.1f}K"
-            )
-        else:
-            formatted_stars = f"<1K"
-        github_info = f"<br/>⭐ {formatted_stars}"
 
-    title_cell = f"**[{resource['title']} <small>&#10548;</small>]({resource['url']})**{github_info}"
+def save_readme_cache(input_digest: str, readme_path: Path) -> None:
+    """Record the digests of this run's inputs and output; best-effort."""
+    try:
+        README_CACHE_PATH.parent.mkdir(exist_ok=True)
+        README_CACHE_PATH.write_text(
+            json.dumps({"input": input_digest, "readme": file_digest(readme_path)}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
 
-    # Consistent emoji usage (emoji only, no text)
-    maturity_cell = MATURITY_EMOJI.get(resource["maturity"], "❓")
 
-    # Use good_for instead of effort since effort was removed
+def prepare_resources(resources: List[Dict[str, Any]]) -> None:
+    """
+    Normalize fields used by grouping and sorting once per resource.
+
+    Adds underscore-prefixed keys in place: _domains (always a list),
+    _tags_lc (lowercased tags), _stars (GitHub stars, 0 if unknown),
+    _maturity, _maturity_cell and _effort_cell (table emoji), _summary
+    (single-line, truncated) and _sort_key.
+    Domain, tag and maturity strings are interned, since they repeat across
+    resources and are used as dict keys when grouping.
+    """
+    for resource in resources:
+        # Empty (null) YAML values are treated like missing ones, and non-string
+        # list entries are skipped, so one bad entry can't stop the build
+        domains = resource.get("domains", resource.get("domain")) or ["Other"]
+        if isinstance(domains, str):
+            domains = [domains]
+        resource["_domains"] = [
+            intern(domain) for domain in domains if isinstance(domain, str)
+        ]
+        resource["_tags_lc"] = tuple(
+            intern(tag.lower())
+            for tag in resource.get("tags") or ()
+            if isinstance(tag, str)
+        )
+        resource["_stars"] = resource.get("github_stars") or 0
+        resource["_maturity"] = intern(resource.get("maturity") or "")
+        resource["_maturity_cell"] = MATURITY_EMOJI.get(resource["_maturity"], "❓")
+        resource["_effort_cell"] = EFFORT_EMOJI[get_effort_level(resource)]
+        # Collapse newlines from folded YAML so a summary can't break its table row
+        summary = resource.get("summary") or ""
+        resource["_summary"] = ellipsize(" ".join(summary.split()))
+        resource["_sort_key"] = get_sort_key(resource)
+
+
+def get_effort_level(resource: Dict[str, Any]) -> str:
+    """Derive the effort level from good_for, since effort was removed."""
     good_for_list = resource.get("good_for", [])
     if "production" in good_for_list:
-        effort_cell = "🎯"  # Production-ready gets priority
-    elif any(x in good_for_list for x in ["mlops", "testing"]):
-        effort_cell = "⚙️"  # Medium complexity
-    else:
-        effort_cell = "🚀"  # High learning/research value
+        return "Low"  # Production-ready gets priority
+    if any(x in good_for_list for x in MEDIUM_EFFORT_GOOD_FOR):
+        return "Medium"  # Medium complexity
+    return "High"  # High learning/research value
 
-    # Clean use cases (limit to first 2-3 for readability)
-    use_cases = ", ".join(resource.get("use_cases", [])[:3])
 
-    # Summary with proper truncation
-    summary = resource["summary"]
-    if len(summary) > 120:
-        summary = summary[:117] + "..."
+def ellipsize(text: str, limit: int = SUMMARY_MAX_LENGTH) -> str:
+    """Cut text to at most limit characters, ending with an ellipsis if shortened."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(ELLIPSIS)] + ELLIPSIS
 
-    return (
-        f"| {title_cell} | {maturity_cell} | {effort_cell} | {use_cases} | {summary} |"
+
+def format_stars(stars: int) -> str:
+    """Format a star count in thousands with one decimal, e.g. 12.3K."""
+    if stars < 1000:
+        return "<1K"
+
+    # Integer-only rounding to the nearest hundred (halves round up)
+    thousands, hundreds = divmod((stars + 50) // 100, 10)
+    if stars % 1000 == 0:
+        return f"{thousands}K"
+    return f"{thousands}.{hundreds}K"
+
+
+def format_resource_row(resource: Dict[str, Any]) -> str:
+    """Format a resource as a table row with improved styling."""
+
+    # Enhanced title with bold formatting and metadata
+    github_info = ""
+    stars = resource["_stars"]
+    if stars:
+        github_info = f"<br/>⭐ {format_stars(stars)}"
+
+    # Clean use cases (limit to first 2-3 for readability)
+    use_cases = ", ".join(islice(resource.get("use_cases", ()), 3))
+
+    return RESOURCE_ROW_TEMPLATE.format_map(
+        {
+            "title": resource["title"],
+            "url": resource["url"],
+            "github_info": github_info,
+            # Consistent emoji usage (emoji only, no text), precomputed per resource
+            "maturity": resource["_maturity_cell"],
+            "effort": resource["_effort_cell"],
+            "use_cases": use_cases,
+            "summary": resource["_summary"],
+        }
     )
 
 
+def get_resource_row(resource: Dict[str, Any]) -> str:
+    """Return the resource's table row, rendering it only the first time."""
+    row = resource.get("_row")
+    if row is None:
+        # Multi-domain resources appear in several tables with the same row
+        row = resource["_row"] = format_resource_row(resource)
+    return row
+
+
+@functools.lru_cache(maxsize=None)
 def parse_date(date_str: Optional[str]) -> datetime:
     """Parse date string in various formats, return datetime for sorting."""
     if not date_str:
         return datetime(1900, 1, 1)  # Very old date for sorting
 
-    # Try different formats
-    formats = ["%Y-%m-%d", "%Y-%m", "%Y"]
-    for fmt in formats:
+    # Only one format can match a given number of separators, so try just that one
+    fmt = DATE_FORMATS.get(date_str.count("-"))
+    if fmt:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
-            continue
+            pass
 
     return datetime(1900, 1, 1)
 
@@ -134,7 +403,7 @@ def parse_date(date_str: Optional[str]) -> datetime:
 def get_sort_key(resource: Dict[str, Any]) -> tuple:
     """Generate sort key for stable, signal-first sorting."""
     # Maturity rank (lower is better)
-    maturity_rank = MATURITY_RANK.get(resource.get("maturity", ""), 99)
+    maturity_rank = MATURITY_RANK.get(resource["_maturity"], 99)
 
     # Date key (newer first)
     last_updated = resource.get("last_updated")
@@ -143,13 +412,13 @@ def get_sort_key(resource: Dict[str, Any]) -> tuple:
     date_key = -int(parse_date(last_updated or published or added).timestamp())
 
     # GitHub stars (more first)
-    github_stars = -(resource.get("github_stars") or 0)
+    github_stars = -resource["_stars"]
 
     # Good_for priority (lower index is better)
     good_for = resource.get("good_for", [])
     good_for_key = min(
-        [GOOD_FOR_PRIORITY.index(g) for g in good_for if g in GOOD_FOR_PRIORITY]
-        or [len(GOOD_FOR_PRIORITY)]
+        (GOOD_FOR_RANK[g] for g in good_for if g in GOOD_FOR_RANK),
+        default=len(GOOD_FOR_PRIORITY),
     )
 
     # Title for alphabetical tiebreak
@@ -161,178 +430,93 @@ def get_sort_key(resource: Dict[str, Any]) -> tuple:
 def group_resources_by_domain(
     resources: List[Dict[str, Any]],
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Group resources by their domains (multi-domain support)."""
-    grouped = defaultdict(list)
-
-    for resource in resources:
-        domains = resource.get("domains", resource.get("domain", ["Other"]))
-        if isinstance(domains, str):
-            domains = [domains]
+    """
+    Group resources by their domains (multi-domain support).
+
+    Domains keep the order they first appear in; resources are sorted once
+    up front, so bucketing leaves each domain's list already in sort order.
+    """
+    grouped = {
+        domain: []
+        for domain in dict.fromkeys(
+            chain.from_iterable(resource["_domains"] for resource in resources)
+        )
+    }
 
-        # Add resource to each of its domains
-        for domain in domains:
+    # Add resource to each of its domains, in advanced sort order
+    for resource in sorted(resources, key=SORT_KEY):
+        for domain in resource["_domains"]:
             grouped[domain].append(resource)
 
-    # Sort within each domain using new advanced sorting
-    for domain in grouped:
-        grouped[domain].sort(key=get_sort_key)
-
-    return dict(grouped)
+    return grouped
 
 
 def get_domain_description(domain: str) -> str:
     """Get a brief description for each domain section."""
-    descriptions = {
-        "AI-Engineering": "Agents/MCP, RAG & knowledge systems, LLM applications, AI integration.",
-        "Machine-Learning": "Training frameworks, MLOps, evaluation, monitoring, model management, ML system design.",
-        "Platform-Engineering": "Observability & performance, infra & services (IaC), container platforms, build & delivery, docs/runbooks.",
-        "Data-Engineering": "Discovery & governance, query & storage, pipelines & orchestration, analytics & BI.",
-        "Security": "Supply chain & vuln mgmt, infra/runtime security, secrets/auth/compliance.",
-        "Developer-Tools": "Code quality, browser/web tools, CLI/editors/productivity, creative/specialized, SLMs.",
-    }
-    return descriptions.get(domain, "Various engineering tools and resources.")
+    return DOMAIN_DESCRIPTIONS.get(domain, "Various engineering tools and resources.")
 
 
-def create_domain_section(domain: str, resources: List[Dict[str, Any]]) -> str:
+def create_domain_section(
+    domain: str,
+    resources: List[Dict[str, Any]],
+    subcategories: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> str:
     """Create a markdown section for a domain with description."""
-    domain_titles = {
-        "AI-Engineering": "🤖 AI Engineering",
-        "Machine-Learning": "🧠 Machine Learning",
-        "Platform-Engineering": "🏗️ Platform Engineering",
-        "Data-Engineering": "📊 Data Engineering",
-        "Security": "🔒 Security & Compliance",
-        "Developer-Tools": "🛠️ Developer Tools",
-    }
-
-    section_title = domain_titles.get(domain, f"📁 {domain}")
+    section_title = DOMAIN_TITLES.get(domain, f"📁 {domain}")
     domain_description = get_domain_description(domain)
 
-    # Group by subcategory using new algorithm
-    subcategories = group_by_subcategory(resources, domain)
+    # Group by subcategory using new algorithm, unless already grouped
+    if subcategories is None:
+        subcategories = group_by_subcategory(resources, domain)
 
-    section = f"\n### {section_title}\n\n"
-    section += f"*{domain_description}*\n\n"
+    parts = [f"\n### {section_title}\n\n", f"*{domain_description}*\n\n"]
 
     for subcategory, subcat_resources in subcategories.items():
-        section += f"<details>\n"
-        section += f"<summary><strong>{subcategory}</strong> ({len(subcat_resources)} resources)</summary>\n\n"
+        parts.append("<details>\n")
+        parts.append(
+            f"<summary><strong>{subcategory}</strong> ({len(subcat_resources)} resources)</summary>\n\n"
+        )
 
         # Table header
-        section += "| Resource | Maturity | Effort | Use Case | Quick Summary |\n"
-        section += "|----------|:--------:|:------:|----------|---------------|\n"
+        parts.append("| Resource | Maturity | Effort | Use Case | Quick Summary |\n")
+        parts.append("|----------|:--------:|:------:|----------|---------------|\n")
 
-        # Resource rows
-        for resource in subcat_resources:
-            section += format_resource_row(resource) + "\n"
+        # Resource rows, one newline-terminated line each
+        rows = [get_resource_row(resource) for resource in subcat_resources]
+        parts.append("\n".join(rows))
+        parts.append("\n")
 
-        section += "\n</details>\n"
+        parts.append("\n</details>\n")
 
-    return section
+    return "".join(parts)
 
 
 def group_by_subcategory(
     resources: List[Dict[str, Any]], domain: str
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Group resources into logical subcategories using new domain-specific rules."""
-    subcategories = defaultdict(list)
+    """
+    Group resources into logical subcategories using new domain-specific rules.
 
-    for resource in resources:
-        tags = [tag.lower() for tag in resource.get("tags", [])]
-
-        if domain == "AI-Engineering":
-            if any(tag in tags for tag in ["agents", "mcp", "integration", "protocol"]):
-                subcategories["Agent Systems & Integration"].append(resource)
-            elif any(
-                tag in tags
-                for tag in ["rag", "graph-rag", "knowledge-graphs", "retrieval"]
-            ):
-                subcategories["RAG & Knowledge Systems"].append(resource)
-            elif any(tag in tags for tag in ["evaluation", "testing", "prompts"]):
-                subcategories["Testing & Evaluation"].append(resource)
-            elif any(
-                tag in tags for tag in ["architecture", "case-studies", "patterns"]
-            ):
-                subcategories["Architecture & Best Practices"].append(resource)
-            else:
-                subcategories["Core AI Tools"].append(resource)
-
-        elif domain == "Machine-Learning":
-            if any(tag in tags for tag in ["training", "frameworks"]):
-                subcategories["Training & Frameworks"].append(resource)
-            elif any(tag in tags for tag in ["mlops", "monitoring", "evaluation"]):
-                subcategories["MLOps & Monitoring"].append(resource)
-            elif any(
-                tag in tags for tag in ["case-studies", "architecture", "patterns"]
-            ):
-                subcategories["ML System Design"].append(resource)
-            elif any(tag in tags for tag in ["learning", "course"]):
-                subcategories["Learning Resources"].append(resource)
-            else:
-                subcategories["ML Tools & Utilities"].append(resource)
-
-        elif domain == "Platform-Engineering":
-            if any(
-                tag in tags for tag in ["performance", "monitoring", "observability"]
-            ):
-                subcategories["Performance & Observability"].append(resource)
-            elif any(
-                tag in tags
-                for tag in ["infrastructure", "iac", "services", "self-hosting"]
-            ):
-                subcategories["Infrastructure & Services (IaC)"].append(resource)
-            elif any(tag in tags for tag in ["containers", "docker", "kubernetes"]):
-                subcategories["Container Platforms"].append(resource)
-            elif any(tag in tags for tag in ["ci-cd", "build", "delivery"]):
-                subcategories["Build & Delivery"].append(resource)
-            elif any(tag in tags for tag in ["documentation", "architecture"]):
-                subcategories["Docs/Runbooks"].append(resource)
-            else:
-                subcategories["Platform Tools"].append(resource)
-
-        elif domain == "Data-Engineering":
-            if any(tag in tags for tag in ["discovery", "governance", "catalog"]):
-                subcategories["Discovery & Governance"].append(resource)
-            elif any(tag in tags for tag in ["query", "sql", "database"]):
-                subcategories["Query & Storage"].append(resource)
-            elif any(tag in tags for tag in ["pipelines", "orchestration", "etl"]):
-                subcategories["Pipelines & Orchestration"].append(resource)
-            elif any(tag in tags for tag in ["analytics", "bi"]):
-                subcategories["Analytics & BI"].append(resource)
-            else:
-                subcategories["Data Infrastructure"].append(resource)
-
-        elif domain == "Security":
-            if any(tag in tags for tag in ["supply-chain", "vulnerability-scanning"]):
-                subcategories["Supply Chain & Vuln Mgmt"].append(resource)
-            elif any(tag in tags for tag in ["runtime-security", "infrastructure"]):
-                subcategories["Infra/Runtime Security"].append(resource)
-            elif any(tag in tags for tag in ["secrets", "auth", "compliance"]):
-                subcategories["Secrets/Auth/Compliance"].append(resource)
-            else:
-                subcategories["Security Tools"].append(resource)
-
-        elif domain == "Developer-Tools":
-            if any(tag in tags for tag in ["small-language-models"]):
-                subcategories["Specialized Models (SLMs)"].append(resource)
-            elif any(
-                tag in tags
-                for tag in ["code-formatting", "linting", "git-hooks", "pre-commit"]
-            ):
-                subcategories["Code Quality & Standards"].append(resource)
-            elif any(tag in tags for tag in ["browser-automation", "chrome-extension"]):
-                subcategories["Browser & Web Tools"].append(resource)
-            elif any(tag in tags for tag in ["creative-tools"]):
-                subcategories["Creative & Specialized Tools"].append(resource)
-            else:
-                subcategories["Development Utilities"].append(resource)
+    Expects resources in sort order (as group_resources_by_domain returns
+    them); bucketing is stable, so each subcategory stays sorted.
+    """
+    subcategories = defaultdict(list)
 
-        else:
-            # Fallback for other domains
-            subcategories["Tools & Utilities"].append(resource)
+    labels, fallback = SUBCATEGORY_RULES.get(domain, ((), DEFAULT_SUBCATEGORY))
+    tag_ranks = SUBCATEGORY_TAG_RANKS.get(domain, {})
 
-    # Sort each subcategory using advanced sorting
-    for subcat_resources in subcategories.values():
-        subcat_resources.sort(key=get_sort_key)
+    for resource in resources:
+        # The earliest rule matching any of the resource's tags wins
+        rank = min(
+            (
+                tag_ranks[tag]
+                for tag in resource["_tags_lc"]
+                if tag in tag_ranks
+            ),
+            default=None,
+        )
+        label = fallback if rank is None else labels[rank]
+        subcategories[label].append(resource)
 
     return dict(subcategories)
 
@@ -342,85 +526,76 @@ def generate_quick_navigation(
 ) -> str:
     """Generate the quick navigation section with descriptions."""
 
-    nav_section = '\n### Quick Navigation\n\n<div align="center">\n\n'
-
-    # Create table header
-    headers = []
-    links = []
-    counts = []
-    descriptions = []
+    parts = ['\n### Quick Navigation\n\n<div align="center">\n\n']
 
+    # One dict of cell values per domain column
+    cells = []
     for domain, resources in grouped_resources.items():
         if domain in DOMAINS:
             emoji_title, anchor, desc = DOMAINS[domain]
-            headers.append(emoji_title)
-            clean_title = (
-                emoji_title.replace("**", "")
-                .replace("🤖 ", "")
-                .replace("🧠 ", "")
-                .replace("🏗️ ", "")
-                .replace("📊 ", "")
-                .replace("🔒 ", "")
-                .replace("🛠️ ", "")
+            cells.append(
+                {
+                    "header": emoji_title,
+                    "title": NAV_TITLES[domain],
+                    "anchor": anchor,
+                    "count": len(resources),
+                    "description": desc,
+                }
             )
-            links.append(f"[Jump to {clean_title}](#{anchor})")
-            counts.append(f"**{len(resources)} resources**")
-            descriptions.append(f"*{desc}*")
 
-    # Build the navigation table
-    nav_section += "| " + " | ".join(headers) + " |\n"
-    nav_section += "|" + ":------------:|" * len(headers) + "\n"
-    nav_section += "| " + " | ".join(links) + " |\n"
-    nav_section += "| " + " | ".join(counts) + " |\n"
-    nav_section += "| " + " | ".join(descriptions) + " |\n"
+    # Build the navigation table: header, alignment row, then one row per template
+    parts.append("| " + " | ".join(cell["header"] for cell in cells) + " |\n")
+    parts.append("|" + ":------------:|" * len(cells) + "\n")
+    for template in NAV_ROW_TEMPLATES:
+        parts.append(
+            "| " + " | ".join(template.format_map(cell) for cell in cells) + " |\n"
+        )
 
-    nav_section += "\n</div>\n\n"
+    parts.append("\n</div>\n\n")
 
     # Simplified quick access with just the badges
-    nav_section += '<div align="center">\n\n'
-    nav_section += "[![Quick Wins](https://img.shields.io/badge/⚡_Quick_Wins-Under_2hrs-brightgreen)](#quick-wins) &nbsp;&nbsp;"
-    nav_section += "[![Production Ready](https://img.shields.io/badge/🛡️_Production_Ready-Battle_tested-blue)](#production-ready) &nbsp;&nbsp;"
-    nav_section += "[![Emerging Tools](https://img.shields.io/badge/🔧_Emerging-Worth_watching-orange)](#emerging-tools)\n\n"
-    nav_section += "</div>\n"
+    parts.append('<div align="center">\n\n')
+    parts.append(
+        "[![Quick Wins](https://img.shields.io/badge/⚡_Quick_Wins-Under_2hrs-brightgreen)](#quick-wins) &nbsp;&nbsp;"
+    )
+    parts.append(
+        "[![Production Ready](https://img.shields.io/badge/🛡️_Production_Ready-Battle_tested-blue)](#production-ready) &nbsp;&nbsp;"
+    )
+    parts.append(
+        "[![Emerging Tools](https://img.shields.io/badge/🔧_Emerging-Worth_watching-orange)](#emerging-tools)\n\n"
+    )
+    parts.append("</div>\n")
 
-    return nav_section
+    return "".join(parts)
 
 
 def generate_quick_wins_section(resources: List[Dict[str, Any]]) -> str:
     """Generate the Quick Wins section with one best resource per domain."""
-    # Use good_for instead of effort for quick wins
-    quick_wins = [
-        r
-        for r in resources
-        if "production" in r.get("good_for", [])
-        and r.get("maturity") in ["Battle-tested", "Emerging"]
-    ]
-
-    if not quick_wins:
-        return ""
-
-    # Group by domain and pick the best resource from each domain
+    # Filter quick wins (good_for instead of effort) and pick the best
+    # resource per domain in the same pass
     domain_best = {}
-    for resource in quick_wins:
-        domains = resource.get("domains", resource.get("domain", ["Other"]))
-        if isinstance(domains, str):
-            domains = [domains]
+    for resource in resources:
+        is_quick_win = (
+            "production" in resource.get("good_for", [])
+            and resource["_maturity"] in QUICK_WIN_MATURITY
+        )
+        if not is_quick_win:
+            continue
 
-        primary_domain = domains[0]
+        primary_domain = resource["_domains"][0]
 
         # If we haven't seen this domain or this resource is better
         if primary_domain not in domain_best:
             domain_best[primary_domain] = resource
         else:
             current_best = domain_best[primary_domain]
-            # Better if: battle-tested > emerging, then higher stars
+            # Better if: more mature (lower rank), then higher stars
             is_better = (
-                resource["maturity"] == "Battle-tested"
-                and current_best["maturity"] != "Battle-tested"
-            ) or (
-                resource["maturity"] == current_best["maturity"]
-                and resource.get("github_stars", 0)
-                > current_best.get("github_stars", 0)
+                MATURITY_RANK[resource["_maturity"]],
+                -resource["_stars"],
+            ) < (
+                MATURITY_RANK[current_best["_maturity"]],
+                -current_best["_stars"],
             )
             if is_better:
                 domain_best[primary_domain] = resource
@@ -428,67 +603,78 @@ def generate_quick_wins_section(resources: List[Dict[str, Any]]) -> str:
     if not domain_best:
         return ""
 
-    section = "\n## Quick Wins\n\n"
-    section += "*Best quick win in each domain - high-impact resources you can implement quickly.*\n\n"
-    section += "| Domain | Use Case | Resource |\n"
-    section += "|:------|----------|----------|\n"
+    parts = [
+        "\n## Quick Wins\n\n",
+        "*Best quick win in each domain - high-impact resources you can implement quickly.*\n\n",
+        "| Domain | Use Case | Resource |\n",
+        "|:------|----------|----------|\n",
+    ]
 
     # Sort domains for consistent output
     for domain in sorted(domain_best.keys()):
         resource = domain_best[domain]
-        use_case = ", ".join(resource.get("use_cases", [])[:2])
+        use_case = ", ".join(islice(resource.get("use_cases", ()), 2))
         emoji_title, _, _ = DOMAINS[domain]
 
-        section += f"| {emoji_title} | {use_case} | **[{resource['title']} <small>&#10548;</small>]({resource['url']})** |\n"
+        parts.append(
+            f"| {emoji_title} | {use_case} | **[{resource['title']} <small>&#10548;</small>]({resource['url']})** |\n"
+        )
 
-    return section + "\n"
+    parts.append("\n")
+    return "".join(parts)
 
 
 def calculate_basic_stats(resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Calculate basic repository statistics."""
+    """
+    Calculate repository statistics together with the domain and
+    subcategory groupings, so the README sections and the summary
+    printout reuse one grouping pass.
+    """
     total_resources = len(resources)
 
-    # Count by domain
-    domain_counts = Counter()
-    for resource in resources:
-        domains = resource.get("domains", resource.get("domain", []))
-        if isinstance(domains, str):
-            domains = [domains]
-        for domain in domains:
-            domain_counts[domain] += 1
+    # Group by domain once; the groups double as the domain counts
+    grouped = group_resources_by_domain(resources)
+    subcategories = {
+        domain: group_by_subcategory(domain_resources, domain)
+        for domain, domain_resources in grouped.items()
+    }
 
     # All unique tags
-    all_tags = []
-    for resource in resources:
-        all_tags.extend(resource.get("tags", []))
+    tag_counts = Counter(chain.from_iterable(r.get("tags") or () for r in resources))
+
+    # Single time source for the badge and the footer timestamp
+    now = datetime.now()
 
     return {
         "total_resources": total_resources,
-        "domains_covered": len(domain_counts),
-        "tag_counts": Counter(all_tags),
-        "last_updated": datetime.now().strftime("%B %Y"),
+        "domains_covered": len(grouped),
+        "tag_counts": tag_counts,
+        "last_updated": now.strftime("%B %Y"),
+        "generated_at": now,
+        "grouped": grouped,
+        "subcategories": subcategories,
     }
 
 
 def generate_tag_cloud(stats: Dict[str, Any]) -> str:
     """Generate tag cloud section."""
-    top_tags = stats["tag_counts"].most_common(12)
+    # Bounded heap over the counts, same ordering as Counter.most_common(12)
+    top_tags = heapq.nlargest(TAG_CLOUD_SIZE, stats["tag_counts"].items(), key=TAG_COUNT)
 
-    section = "\n## Tag Cloud\n\n"
     tag_list = " ".join([f"`{tag}`" for tag, _ in top_tags])
-    section += tag_list + "\n"
 
-    return section
+    return f"\n## Tag Cloud\n\n{tag_list}\n"
 
 
-def update_readme_template(
+def iter_readme(
     resources: List[Dict[str, Any]], stats: Dict[str, Any]
-) -> str:
-    """Generate the complete README.md content."""
-    grouped = group_resources_by_domain(resources)
+) -> Iterator[str]:
+    """Yield the README.md content section by section."""
+    grouped = stats["grouped"]
+    subcategories = stats["subcategories"]
 
     # Header with improved badges
-    readme_content = f"""# Engineering Arsenal (Knowledgebase)
+    yield f"""# Engineering Arsenal (Knowledgebase)
 
 A curated, enterprise-grade collection of links, repos, and notes that actually helped me build real systems (AI, Platform, Data, Security, Developer Tools). Each entry includes structured metadata, honest assessments, and why it's useful in practice.
 
@@ -522,14 +708,14 @@ Here you will find tools and resources organized by engineering domain, each wit
 
     # Generate domain sections
     for domain, domain_resources in grouped.items():
-        readme_content += create_domain_section(domain, domain_resources)
-        readme_content += "\n---\n"
+        yield create_domain_section(domain, domain_resources, subcategories[domain])
+        yield "\n---\n"
 
     # Add Quick Wins section
-    readme_content += generate_quick_wins_section(resources)
+    yield generate_quick_wins_section(resources)
 
     # Contributing section
-    readme_content += """
+    yield """
 ## Contributing
 
 Found a resource that significantly improved your engineering workflow?
@@ -547,10 +733,10 @@ Found a resource that significantly improved your engineering workflow?
 """
 
     # Tag cloud only
-    readme_content += generate_tag_cloud(stats)
+    yield generate_tag_cloud(stats)
 
     # Footer
-    readme_content += f"""
+    yield f"""
 ---
 
 ## Recognition
@@ -567,29 +753,47 @@ Content and curation by [@taghikhah](https://github.com/taghikhah). Resource des
 
 ⭐ **Star this repo** if you find it valuable • **[Share feedback](../../discussions)**
 
-<!-- Auto-generated from data/resources.yaml on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -->
+<!-- Auto-generated from data/resources.yaml on {stats['generated_at'].strftime('%Y-%m-%d %H:%M:%S')} -->
 """
 
-    return readme_content
+
+def update_readme_template(
+    resources: List[Dict[str, Any]], stats: Dict[str, Any]
+) -> str:
+    """Generate the complete README.md content."""
+    return "".join(iter_readme(resources, stats))
 
 
 def main():
     """Main execution function."""
     try:
+        # Skip the rebuild when neither the inputs nor README.md changed since last run
+        readme_path = Path("README.md")
+        yaml_path = Path("data/resources.yaml")
+        input_digest = compute_input_digest(yaml_path) if yaml_path.exists() else None
+        if input_digest and readme_is_current(input_digest, readme_path):
+            print("♻️ README.md is up to date with data/resources.yaml, skipping")
+            return 0
+
         print("🔄 Loading resources from YAML...")
         data = load_resources()
         resources = data["resources"]
 
         print(f"📊 Processing {len(resources)} resources...")
+        prepare_resources(resources)
         stats = calculate_basic_stats(resources)
 
         print("📝 Generating polished README.md with advanced categorization...")
-        readme_content = update_readme_template(resources, stats)
 
-        # Write to README.md
-        readme_path = Path("README.md")
-        with open(readme_path, "w", encoding="utf-8") as file:
-            file.write(readme_content)
+        # Stream sections to a temporary file instead of building one string,
+        # then swap it in so a failed run never leaves a truncated README.md
+        with atomic_write(
+            readme_path, "w", encoding="utf-8", buffering=README_WRITE_BUFFER
+        ) as file:
+            file.writelines(iter_readme(resources, stats))
+
+        if input_digest:
+            save_readme_cache(input_digest, readme_path)
 
         print(
             f"✅ Successfully generated README.md with {stats['total_resources']} resources!"
@@ -599,9 +803,8 @@ def main():
         )
 
         # Show domain breakdown
-        grouped = group_resources_by_domain(resources)
-        for domain, domain_resources in grouped.items():
-            subcats = group_by_subcategory(domain_resources, domain)
+        for domain, domain_resources in stats["grouped"].items():
+            subcats = stats["subcategories"][domain]
             print(
                 f"  🔹 {domain}: {len(domain_resources)} resources in {len(subcats)} subcategories"
             )
@@ -5,10 +5,98 @@ Update GitHub star counts for repositories in resources.yaml
 
 import yaml
 import requests
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+from _fs import atomic_write
+from _http import create_session
+from _yaml_cache import LOADER, DUMPER
+
+# REST lookups only run when GraphQL failed, when throttling is likely; GitHub
+# asks for serial requests, so keep only a few in flight
+MAX_WORKERS = 4
+
+# Attempts per REST lookup, and the longest Retry-After wait honoured (seconds)
+REST_ATTEMPTS = 3
+MAX_RETRY_AFTER = 60
+
+# Repositories looked up per GraphQL query (aliased repository fields)
+GRAPHQL_URL = 'https://api.github.com/graphql'
+GRAPHQL_BATCH = 80
+
+
+
+def build_stars_query(repos: List[Tuple[str, str]]) -> str:
+    """Build one GraphQL query asking for the star counts of all given repos."""
+    fields = ' '.join(
+        f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ stargazerCount }}'
+        for i, (owner, name) in enumerate(repos)
+    )
+    return f'query {{ {fields} }}'
+
+
+def fetch_stars_graphql(session: requests.Session, repos: List[Tuple[str, str]]) -> Dict[int, int]:
+    """
+    Fetch star counts in batches through the GraphQL API.
+
+    Returns:
+        Dict mapping indexes into repos to star counts; repos that are
+        missing from the response (not found, failed batch) are left out
+    """
+    stars = {}
+    for start in range(0, len(repos), GRAPHQL_BATCH):
+        batch = repos[start:start + GRAPHQL_BATCH]
+        try:
+            response = session.post(GRAPHQL_URL, json={'query': build_stars_query(batch)}, timeout=30)
+            if response.status_code != 200:
+                print(f"⚠️ GraphQL star lookup failed: HTTP {response.status_code}, falling back to REST")
+                continue
+            data = response.json().get('data') or {}
+        except (requests.RequestException, ValueError) as e:
+            print(f"⚠️ GraphQL star lookup failed: {str(e)[:100]}, falling back to REST")
+            continue
+
+        for i in range(len(batch)):
+            node = data.get(f'r{i}')
+            if node:
+                stars[start + i] = node['stargazerCount']
+    return stars
+
+
+def fetch_repo(session: requests.Session, owner: str, repo: str) -> requests.Response:
+    """GET a repo over REST, backing off when a 403/429 carries Retry-After."""
+    url = f'https://api.github.com/repos/{owner}/{repo}'
+    for attempt in range(1, REST_ATTEMPTS + 1):
+        response = session.get(url, timeout=15)
+        if response.status_code not in (403, 429) or attempt == REST_ATTEMPTS:
+            return response
+
+        # Secondary rate limits send Retry-After; a plain 403 is returned as is
+        try:
+            delay = int(response.headers['Retry-After'])
+        except (KeyError, ValueError):
+            return response
+        time.sleep(min(delay, MAX_RETRY_AFTER))
+
+
+def apply_stars(resource: Dict[str, Any], resource_id: str, new_stars: int) -> bool:
+    """Store a fetched star count on the resource; return True if it changed."""
+    # A missing or null count is treated as 0 so it gets filled in
+    old_stars = resource.get('github_stars') or 0
+
+    if new_stars != old_stars:
+        resource['github_stars'] = new_stars
+        change = "+" if new_stars > old_stars else ""
+        print(f"✅ Updated {resource_id}: {old_stars} -> {new_stars} stars ({change}{new_stars - old_stars})")
+        return True
+
+    print(f"ℹ️ {resource_id}: {new_stars} stars (unchanged)")
+    return False
 
 
 def update_github_stars(github_token: str) -> bool:
@@ -19,24 +107,23 @@ def update_github_stars(github_token: str) -> bool:
         print(f"❌ Resources file not found: {yaml_path}")
         return False
 
-    # Load resources
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    # Load resources (a private copy, since star counts are updated in place)
+    data = yaml.load(yaml_path.read_bytes(), Loader=LOADER)
 
     if 'resources' not in data:
         print("❌ No 'resources' key found in YAML")
         return False
 
-    # GitHub API headers
-    headers = {
+    session = create_session({
         'Authorization': f'token {github_token}',
         'Accept': 'application/vnd.github.v3+json',
         'User-Agent': 'Engineering-Arsenal-Bot/1.0'
-    }
+    })
 
     updated_count = 0
     total_repos = 0
 
+    to_fetch = []
     for resource in data['resources']:
         url = resource.get('url', '')
         resource_id = resource.get('id', 'unknown')
@@ -47,53 +134,59 @@ def update_github_stars(github_token: str) -> bool:
 
         total_repos += 1
 
-        try:
-            # Extract owner/repo from GitHub URL
-            parts = url.replace('https://github.com/', '').strip('/').split('/')
-            if len(parts) < 2:
-                print(f"⚠️ Invalid GitHub URL format for {resource_id}: {url}")
-                continue
-
-            owner, repo = parts[0], parts[1]
-
-            # Fetch current stars
-            api_url = f'https://api.github.com/repos/{owner}/{repo}'
-            response = requests.get(api_url, headers=headers, timeout=15)
-
-            if response.status_code == 200:
-                repo_data = response.json()
-                new_stars = repo_data.get('stargazers_count', 0)
-                old_stars = resource.get('github_stars', 0)
+        # Extract owner/repo from GitHub URL
+        parts = url.replace('https://github.com/', '').strip('/').split('/')
+        if len(parts) < 2:
+            print(f"⚠️ Invalid GitHub URL format for {resource_id}: {url}")
+            continue
 
-                if new_stars != old_stars:
-                    resource['github_stars'] = new_stars
-                    updated_count += 1
-                    change = "+" if new_stars > old_stars else ""
-                    print(f"✅ Updated {resource_id}: {old_stars} -> {new_stars} stars ({change}{new_stars - old_stars})")
+        to_fetch.append((resource, resource_id, url, parts[0], parts[1]))
+
+    # Batch lookups through GraphQL: one request per GRAPHQL_BATCH repos
+    graphql_stars = fetch_stars_graphql(session, [(owner, repo) for _, _, _, owner, repo in to_fetch])
+
+    # Fetch whatever GraphQL didn't return over REST, concurrently; apply and report in resource order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            i: executor.submit(fetch_repo, session, owner, repo)
+            for i, (_, _, _, owner, repo) in enumerate(to_fetch)
+            if i not in graphql_stars
+        }
+
+        for i, (resource, resource_id, url, owner, repo) in enumerate(to_fetch):
+            try:
+                if i in graphql_stars:
+                    updated_count += apply_stars(resource, resource_id, graphql_stars[i])
+                    continue
+
+                response = futures[i].result()
+
+                if response.status_code == 200:
+                    repo_data = response.json()
+                    updated_count += apply_stars(resource, resource_id, repo_data.get('stargazers_count', 0))
+
+                elif response.status_code == 404:
+                    print(f"⚠️ Repository not found for {resource_id}: {url}")
+                elif response.status_code == 403:
+                    print(f"⚠️ Rate limited or forbidden for {resource_id}: {url}")
+                    if 'X-RateLimit-Remaining' in response.headers:
+                        remaining = response.headers['X-RateLimit-Remaining']
+                        reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
+                        print(f"   Rate limit remaining: {remaining}, resets at: {reset_time}")
                 else:
-                    print(f"ℹ️ {resource_id}: {new_stars} stars (unchanged)")
-
-            elif response.status_code == 404:
-                print(f"⚠️ Repository not found for {resource_id}: {url}")
-            elif response.status_code == 403:
-                print(f"⚠️ Rate limited or forbidden for {resource_id}: {url}")
-                if 'X-RateLimit-Remaining' in response.headers:
-                    remaining = response.headers['X-RateLimit-Remaining']
-                    reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
-                    print(f"   Rate limit remaining: {remaining}, resets at: {reset_time}")
-            else:
-                print(f"⚠️ Failed to fetch stars for {resource_id}: HTTP {response.status_code}")
-
-        except requests.RequestException as e:
-            print(f"❌ Network error for {resource_id}: {str(e)[:100]}")
-        except Exception as e:
-            print(f"❌ Error processing {resource_id}: {str(e)[:100]}")
+                    print(f"⚠️ Failed to fetch stars for {resource_id}: HTTP {response.status_code}")
+
+            except requests.RequestException as e:
+                print(f"❌ Network error for {resource_id}: {str(e)[:100]}")
+            except Exception as e:
+                print(f"❌ Error processing {resource_id}: {str(e)[:100]}")
 
     # Save updated data if changes were made
     if updated_count > 0:
+        # Write a temporary file and swap it in so an interrupted run can't corrupt the YAML
         try:
-            with open(yaml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            with atomic_write(yaml_path, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, Dumper=DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True)
             print(f"\n🎉 Successfully updated {updated_count}/{total_repos} repositories")
             return True
         except Exception as e:
@@ -4,13 +4,18 @@ Validate resources.yaml schema and content quality.
 Run this before committing changes to catch issues early.
 """
 
+import calendar
+import functools
+import os
 import yaml
 import re
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from urllib.parse import urlparse
-from datetime import datetime
+
+from _yaml_cache import load_resources_cached
 
 # Schema definition
 REQUIRED_FIELDS = [
@@ -80,6 +85,124 @@ VALID_GOOD_FOR = [
     "creative-projects",
 ]
 
+# Expected type of each typed field, checked in this order
+FIELD_TYPES = (
+    ("id", str, "a string"),
+    ("title", str, "a string"),
+    ("url", str, "a string"),
+    ("type", str, "a string"),
+    ("maturity", str, "a string"),
+    ("summary", str, "a string"),
+    ("why_useful", str, "a string"),
+    ("published", str, "a string"),
+    ("last_updated", str, "a string"),
+    ("added", str, "a string"),
+    ("domains", list, "a list"),
+    ("tags", list, "a list"),
+    ("good_for", list, "a list"),
+    ("prerequisites", list, "a list"),
+    ("use_cases", list, "a list"),
+    ("related", list, "a list"),
+    ("github_stars", int, "an integer"),
+)
+
+# Hashed copies of the schema lists for set checks; the lists above keep
+# their order for error messages
+REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+VALID_DOMAIN_SET = frozenset(VALID_DOMAINS)
+VALID_TYPE_SET = frozenset(VALID_TYPES)
+VALID_MATURITY_SET = frozenset(VALID_MATURITY)
+VALID_GOOD_FOR_SET = frozenset(VALID_GOOD_FOR)
+
+# Allowed-value listings appended to error messages, formatted once
+VALID_DOMAINS_MSG = f"Valid: {VALID_DOMAINS}"
+VALID_TYPES_MSG = f"Valid: {VALID_TYPES}"
+VALID_MATURITY_MSG = f"Valid: {VALID_MATURITY}"
+VALID_GOOD_FOR_MSG = f"Valid: {VALID_GOOD_FOR}"
+
+# Concurrent HEAD requests in the optional URL accessibility check
+URL_CHECK_WORKERS = 16
+
+# Resource lists longer than this are validated across a process pool,
+# PARALLEL_CHUNK resources per task
+PARALLEL_THRESHOLD = 500
+PARALLEL_CHUNK = 64
+
+# scheme://host prefix of a plain ASCII URL; anything else is left to urlparse
+URL_PREFIX_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.-]*)://[^/?#\[\]\s]+(?:[/?#]|\Z)")
+
+# Canonical GitHub repository URL: https://github.com/owner/repo
+GITHUB_URL_RE = re.compile(r"https://github\.com/[\w\-\.]+/[\w\-\.]+/?$")
+
+# YYYY-MM-DD, YYYY-MM or YYYY, with the same fields strptime's %Y, %m and %d accept
+DATE_RE = re.compile(
+    r"(\d{4})(?:-(1[0-2]|0[1-9]|[1-9])(?:-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9]))?)?"
+)
+
+# Marketing phrases that usually stand in for a specific description
+GENERIC_PHRASES = [
+    "great tool",
+    "awesome",
+    "amazing",
+    "best",
+    "perfect",
+    "helps you",
+    "makes it easy",
+    "simple tool",
+]
+GENERIC_PHRASES_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in GENERIC_PHRASES), re.IGNORECASE
+)
+
+
+def is_valid_date(value: str) -> bool:
+    """Check a date string against DATE_RE, including year and day-of-month ranges."""
+    match = DATE_RE.fullmatch(value)
+    if not match:
+        return False
+
+    year, month, day = match.groups()
+    year = int(year)
+    if year < 1:
+        return False
+    if day is None:
+        return True
+    return int(day) <= calendar.monthrange(year, int(month))[1]
+
+
+@functools.lru_cache(maxsize=4096)
+def url_scheme(url: str) -> Optional[str]:
+    """Return the lowercased scheme of a URL that has a scheme and a host, else None."""
+    match = URL_PREFIX_RE.match(url)
+    if match and url.isascii():
+        return match.group(1).lower()
+
+    parsed = urlparse(url)
+    return parsed.scheme if parsed.scheme and parsed.netloc else None
+
+
+def invalid_values(values: List[Any], allowed: frozenset) -> List[Any]:
+    """Return the entries of values that are not allowed strings, in order."""
+    try:
+        if allowed.issuperset(values):
+            return []
+    except TypeError:
+        pass  # An unhashable entry, which the per-entry check reports
+
+    return [v for v in values if not isinstance(v, str) or v not in allowed]
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """Normalize URL for duplicate detection."""
+    # Remove trailing slash, convert to lowercase
+    normalized = url.lower().rstrip("/")
+
+    # Remove common variations
+    normalized = normalized.replace("www.", "")
+
+    return normalized
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -90,100 +213,112 @@ class ValidationError(Exception):
 class ResourceValidator:
     """Validates individual resources and the collection as a whole."""
 
+    __slots__ = ("errors", "warnings", "duplicate_id_indices", "duplicate_url_indices")
+
     def __init__(self):
         self.errors = []
         self.warnings = []
-        self.seen_ids = set()
-        self.seen_urls = set()
+        # Indices of resources whose ID or URL already appeared earlier in the list
+        self.duplicate_id_indices: Set[int] = set()
+        self.duplicate_url_indices: Set[int] = set()
+
+    def index_duplicates(self, resources: List[Dict[str, Any]]) -> None:
+        """Find repeated IDs and normalized URLs in one pass before per-resource checks."""
+        seen_ids = set()
+        seen_urls = set()
+        for index, resource in enumerate(resources):
+            resource_id = resource.get("id")
+            if isinstance(resource_id, str):
+                if resource_id in seen_ids:
+                    self.duplicate_id_indices.add(index)
+                seen_ids.add(resource_id)
+
+            url = resource.get("url")
+            if url and isinstance(url, str):
+                normalized_url = normalize_url(url)
+                if normalized_url in seen_urls:
+                    self.duplicate_url_indices.add(index)
+                seen_urls.add(normalized_url)
 
     def validate_resource(self, resource: Dict[str, Any], index: int) -> None:
         """Validate a single resource entry."""
         resource_id = resource.get("id", f"resource_{index}")
 
-        try:
-            self._validate_required_fields(resource, resource_id)
-            self._validate_field_types(resource, resource_id)
-            self._validate_field_values(resource, resource_id)
-            self._validate_uniqueness(resource, resource_id)
-            self._validate_content_quality(resource, resource_id)
-            self._validate_url_format(resource, resource_id)
+        # Later checks assume every field is present and well typed
+        if not self._validate_required_fields(resource, resource_id):
+            return
+        if not self._validate_field_types(resource, resource_id):
+            return
 
-        except ValidationError as e:
-            self.errors.append(f"Resource '{resource_id}': {e}")
+        # The remaining checks are independent, so report every failure
+        self._validate_field_values(resource, resource_id)
+        self._validate_uniqueness(resource, resource_id, index)
+        self._validate_content_quality(resource, resource_id)
+        self._validate_url_format(resource, resource_id)
+
+    def _error(self, resource_id: str, message: str) -> bool:
+        """Record an error for a resource and return False, marking the check as failed."""
+        self.errors.append(f"Resource '{resource_id}': {message}")
+        return False
 
     def _validate_required_fields(
         self, resource: Dict[str, Any], resource_id: str
-    ) -> None:
+    ) -> bool:
         """Check that all required fields are present."""
+        if REQUIRED_FIELD_SET <= resource.keys():
+            return True
+
+        # List the missing fields in schema order
         missing_fields = [field for field in REQUIRED_FIELDS if field not in resource]
-        if missing_fields:
-            raise ValidationError(f"Missing required fields: {missing_fields}")
+        return self._error(resource_id, f"Missing required fields: {missing_fields}")
 
-    def _validate_field_types(self, resource: Dict[str, Any], resource_id: str) -> None:
+    def _validate_field_types(self, resource: Dict[str, Any], resource_id: str) -> bool:
         """Validate field data types."""
-        # String fields
-        string_fields = [
-            "id",
-            "title",
-            "url",
-            "type",
-            "maturity",
-            "summary",
-            "why_useful",
-            "published",
-            "last_updated",
-            "added",
-        ]
-        for field in string_fields:
-            if field in resource and not isinstance(resource[field], str):
-                raise ValidationError(f"Field '{field}' must be a string")
-
-        # List fields
-        list_fields = ["domains", "tags", "good_for", "prerequisites", "use_cases", "related"]
-        for field in list_fields:
-            if field in resource and not isinstance(resource[field], list):
-                raise ValidationError(f"Field '{field}' must be a list")
-
-        # Integer fields
-        int_fields = ["github_stars"]
-        for field in int_fields:
-            if field in resource and not isinstance(resource[field], int):
-                raise ValidationError(f"Field '{field}' must be an integer")
+        valid = True
+        for field, expected_type, description in FIELD_TYPES:
+            if field in resource and not isinstance(resource[field], expected_type):
+                valid = self._error(resource_id, f"Field '{field}' must be {description}")
+        return valid
 
     def _validate_field_values(
         self, resource: Dict[str, Any], resource_id: str
-    ) -> None:
+    ) -> bool:
         """Validate field values against allowed options."""
+        valid = True
 
         # Domain validation
         domains = resource.get("domains", [])
         if len(domains) > 3:
-            raise ValidationError("Maximum 3 domains allowed")
+            valid = self._error(resource_id, "Maximum 3 domains allowed")
 
-        invalid_domains = [d for d in domains if d not in VALID_DOMAINS]
+        invalid_domains = invalid_values(domains, VALID_DOMAIN_SET)
         if invalid_domains:
-            raise ValidationError(
-                f"Invalid domains: {invalid_domains}. Valid: {VALID_DOMAINS}"
+            valid = self._error(
+                resource_id,
+                f"Invalid domains: {invalid_domains}. {VALID_DOMAINS_MSG}",
             )
 
         # Type validation
-        if resource.get("type") not in VALID_TYPES:
-            raise ValidationError(
-                f"Invalid type: {resource.get('type')}. Valid: {VALID_TYPES}"
+        if resource.get("type") not in VALID_TYPE_SET:
+            valid = self._error(
+                resource_id,
+                f"Invalid type: {resource.get('type')}. {VALID_TYPES_MSG}",
             )
 
         # Maturity validation
-        if resource.get("maturity") not in VALID_MATURITY:
-            raise ValidationError(
-                f"Invalid maturity: {resource.get('maturity')}. Valid: {VALID_MATURITY}"
+        if resource.get("maturity") not in VALID_MATURITY_SET:
+            valid = self._error(
+                resource_id,
+                f"Invalid maturity: {resource.get('maturity')}. {VALID_MATURITY_MSG}",
             )
 
         # Good for validation
         good_for = resource.get("good_for", [])
-        invalid_good_for = [g for g in good_for if g not in VALID_GOOD_FOR]
+        invalid_good_for = invalid_values(good_for, VALID_GOOD_FOR_SET)
         if invalid_good_for:
-            raise ValidationError(
-                f"Invalid good_for values: {invalid_good_for}. Valid: {VALID_GOOD_FOR}"
+            valid = self._error(
+                resource_id,
+                f"Invalid good_for values: {invalid_good_for}. {VALID_GOOD_FOR_MSG}",
             )
 
         # Tags validation
@@ -199,35 +334,26 @@ class ResourceValidator:
             if field in resource:
                 date_value = resource[field]
                 # Allow YYYY-MM-DD or YYYY-MM or YYYY formats
-                valid_formats = ["%Y-%m-%d", "%Y-%m", "%Y"]
-                is_valid = False
-                for fmt in valid_formats:
-                    try:
-                        datetime.strptime(date_value, fmt)
-                        is_valid = True
-                        break
-                    except ValueError:
-                        continue
-
-                if not is_valid:
-                    raise ValidationError(
-                        f"Invalid date format for '{field}': {date_value}. Use YYYY-MM-DD, YYYY-MM, or YYYY"
+                if not is_valid_date(date_value):
+                    valid = self._error(
+                        resource_id,
+                        f"Invalid date format for '{field}': {date_value}. Use YYYY-MM-DD, YYYY-MM, or YYYY",
                     )
 
-    def _validate_uniqueness(self, resource: Dict[str, Any], resource_id: str) -> None:
-        """Check for duplicate IDs and URLs."""
-        # Check duplicate IDs
-        if resource_id in self.seen_ids:
-            raise ValidationError(f"Duplicate ID: {resource_id}")
-        self.seen_ids.add(resource_id)
+        return valid
 
-        # Check duplicate URLs
-        url = resource.get("url")
-        if url:
-            normalized_url = self._normalize_url(url)
-            if normalized_url in self.seen_urls:
-                raise ValidationError(f"Duplicate URL: {url}")
-            self.seen_urls.add(normalized_url)
+    def _validate_uniqueness(
+        self, resource: Dict[str, Any], resource_id: str, index: int
+    ) -> bool:
+        """Check for duplicate IDs and URLs found by index_duplicates."""
+        valid = True
+        if index in self.duplicate_id_indices:
+            valid = self._error(resource_id, f"Duplicate ID: {resource_id}")
+
+        if index in self.duplicate_url_indices:
+            valid = self._error(resource_id, f"Duplicate URL: {resource['url']}")
+
+        return valid
 
     def _validate_content_quality(
         self, resource: Dict[str, Any], resource_id: str
@@ -236,13 +362,14 @@ class ResourceValidator:
 
         # Summary length check
         summary = resource.get("summary", "")
-        if len(summary) < 50:
+        summary_length = len(summary)
+        if summary_length < 50:
             self.warnings.append(
-                f"Resource '{resource_id}': Summary too short ({len(summary)} chars), recommend 50+"
+                f"Resource '{resource_id}': Summary too short ({summary_length} chars), recommend 50+"
             )
-        elif len(summary) > 300:
+        elif summary_length > 300:
             self.warnings.append(
-                f"Resource '{resource_id}': Summary too long ({len(summary)} chars), recommend under 300"
+                f"Resource '{resource_id}': Summary too long ({summary_length} chars), recommend under 300"
             )
 
         # Why useful check
@@ -259,60 +386,44 @@ class ResourceValidator:
                 f"Resource '{resource_id}': Title too long, consider shortening"
             )
 
-        # Check for generic descriptions
-        generic_phrases = [
-            "great tool",
-            "awesome",
-            "amazing",
-            "best",
-            "perfect",
-            "helps you",
-            "makes it easy",
-            "simple tool",
-        ]
+        # Check for generic descriptions: one scan per text, reported in phrase order
+        found_phrases = {
+            match.group(0).lower()
+            for text in (summary, why_useful)
+            for match in GENERIC_PHRASES_RE.finditer(text)
+        }
 
-        for phrase in generic_phrases:
-            if (
-                phrase.lower() in summary.lower()
-                or phrase.lower() in why_useful.lower()
-            ):
+        for phrase in GENERIC_PHRASES:
+            if phrase in found_phrases:
                 self.warnings.append(
                     f"Resource '{resource_id}': Avoid generic phrase '{phrase}', be more specific"
                 )
 
-    def _validate_url_format(self, resource: Dict[str, Any], resource_id: str) -> None:
+    def _validate_url_format(self, resource: Dict[str, Any], resource_id: str) -> bool:
         """Validate URL format and accessibility."""
         url = resource.get("url")
         if not url:
-            return
+            return True
 
         # Basic URL format check
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValidationError(f"Invalid URL format: {url}")
+        scheme = url_scheme(url)
+        if scheme is None:
+            return self._error(resource_id, f"Invalid URL format: {url}")
 
         # HTTPS preference
-        if parsed.scheme != "https":
+        if scheme != "https":
             self.warnings.append(
                 f"Resource '{resource_id}': Consider HTTPS URL if available"
             )
 
         # GitHub specific validation
         if "github.com" in url:
-            if not re.match(r"https://github\.com/[\w\-\.]+/[\w\-\.]+/?$", url):
+            if not GITHUB_URL_RE.match(url):
                 self.warnings.append(
                     f"Resource '{resource_id}': GitHub URL should be in format https://github.com/owner/repo"
                 )
 
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL for duplicate detection."""
-        # Remove trailing slash, convert to lowercase
-        normalized = url.lower().rstrip("/")
-
-        # Remove common variations
-        normalized = normalized.replace("www.", "")
-
-        return normalized
+        return True
 
     def validate_cross_references(self, resources: List[Dict[str, Any]]) -> None:
         """Validate cross-references between resources."""
@@ -334,23 +445,36 @@ class ResourceValidator:
         """Check if URLs are accessible (optional, can be slow)."""
         print("🔍 Checking URL accessibility (this may take a moment)...")
 
-        for resource in resources[:5]:  # Limit to first 5 for speed
-            url = resource.get("url")
-            resource_id = resource.get("id")
+        to_check = [
+            (resource.get("id"), resource["url"])
+            for resource in resources
+            if resource.get("url")
+        ]
 
-            if not url:
-                continue
+        # HEAD each distinct URL (ignoring a trailing slash) once, concurrently over
+        # one keep-alive session; warnings are still recorded in resource order
+        with requests.Session() as session, ThreadPoolExecutor(
+            max_workers=URL_CHECK_WORKERS
+        ) as executor:
+            futures = {}
+            for _, url in to_check:
+                request_key = url.rstrip("/")
+                if request_key not in futures:
+                    futures[request_key] = executor.submit(
+                        session.head, url, timeout=timeout, allow_redirects=True
+                    )
 
-            try:
-                response = requests.head(url, timeout=timeout, allow_redirects=True)
-                if response.status_code >= 400:
+            for resource_id, url in to_check:
+                try:
+                    response = futures[url.rstrip("/")].result()
+                    if response.status_code >= 400:
+                        self.warnings.append(
+                            f"Resource '{resource_id}': URL returned {response.status_code}"
+                        )
+                except requests.RequestException as e:
                     self.warnings.append(
-                        f"Resource '{resource_id}': URL returned {response.status_code}"
+                        f"Resource '{resource_id}': URL check failed - {str(e)[:50]}"
                     )
-            except requests.RequestException as e:
-                self.warnings.append(
-                    f"Resource '{resource_id}': URL check failed - {str(e)[:50]}"
-                )
 
 
 def load_and_validate_yaml() -> Dict[str, Any]:
@@ -361,8 +485,7 @@ def load_and_validate_yaml() -> Dict[str, Any]:
         raise FileNotFoundError(f"Resources file not found: {yaml_path}")
 
     try:
-        with open(yaml_path, "r", encoding="utf-8") as file:
-            data = yaml.safe_load(file)
+        data = load_resources_cached(yaml_path)
     except yaml.YAMLError as e:
         raise ValidationError(f"Invalid YAML format: {e}")
 
@@ -378,6 +501,79 @@ def load_and_validate_yaml() -> Dict[str, Any]:
     return data
 
 
+def _validate_chunk(
+    task: Tuple[int, List[Dict[str, Any]], Set[int], Set[int]]
+) -> Tuple[List[str], List[str]]:
+    """Validate one slice of the resource list; return its errors and warnings."""
+    start, resources, duplicate_id_indices, duplicate_url_indices = task
+    validator = ResourceValidator()
+    validator.duplicate_id_indices = duplicate_id_indices
+    validator.duplicate_url_indices = duplicate_url_indices
+
+    for i, resource in enumerate(resources, start):
+        validator.validate_resource(resource, i)
+
+    return validator.errors, validator.warnings
+
+
+def validate_resources(resources: List[Dict[str, Any]]) -> ResourceValidator:
+    """Run all resource and cross-reference checks, returning the populated validator."""
+    validator = ResourceValidator()
+    validator.index_duplicates(resources)
+
+    # Validate each resource; per-resource checks share no state once
+    # duplicates are indexed, so large lists are split across processes
+    validated = False
+    if (os.cpu_count() or 1) > 1 and len(resources) > PARALLEL_THRESHOLD:
+        tasks = [
+            (
+                start,
+                resources[start : start + PARALLEL_CHUNK],
+                validator.duplicate_id_indices,
+                validator.duplicate_url_indices,
+            )
+            for start in range(0, len(resources), PARALLEL_CHUNK)
+        ]
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_validate_chunk, tasks))
+            for errors, warnings in results:
+                validator.errors.extend(errors)
+                validator.warnings.extend(warnings)
+            validated = True
+        except Exception:
+            pass  # No usable process pool, validate serially
+
+    if not validated:
+        for i, resource in enumerate(resources):
+            validator.validate_resource(resource, i)
+
+    # Validate cross-references
+    validator.validate_cross_references(resources)
+
+    return validator
+
+
+def run_validation(
+    resources: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[int, List[str]]:
+    """
+    Validate resources without printing a report.
+
+    Pass an already-loaded resource list to avoid reading resources.yaml again.
+
+    Returns:
+        Tuple of (exit code, warnings); the exit code is 1 if any errors were found
+    """
+    if resources is None:
+        resources = load_and_validate_yaml()["resources"]
+    elif not isinstance(resources, list):
+        raise ValidationError("'resources' must be a list")
+
+    validator = validate_resources(resources)
+    return (1 if validator.errors else 0), validator.warnings
+
+
 def main():
     """Main validation function."""
     print("🔍 Validating resources.yaml...")
@@ -389,15 +585,8 @@ def main():
 
         print(f"📊 Found {len(resources)} resources to validate")
 
-        # Initialize validator
-        validator = ResourceValidator()
-
-        # Validate each resource
-        for i, resource in enumerate(resources):
-            validator.validate_resource(resource, i)
-
-        # Validate cross-references
-        validator.validate_cross_references(resources)
+        # Validate each resource and cross-references
+        validator = validate_resources(resources)
 
         # Optional URL accessibility check (uncomment if needed)
         # validator.check_url_accessibility(resources)